@@ -18,6 +18,8 @@ This module provides resources for accessing AWS MSK best practices and recommen
 """
 
 import json
+from collections import namedtuple
+from functools import lru_cache
 from mcp.server.fastmcp import FastMCP
 
 
@@ -293,9 +295,121 @@ INSTANCE_SPECS = {
 }
 
 
+# Tuple view of INSTANCE_SPECS for attribute access in get_cluster_best_practices
+InstanceSpec = namedtuple(
+    'InstanceSpec',
+    'vcpu mem_gb net_gbps ingress_rec ingress_max egress_rec egress_max '
+    'partitions_rec partitions_max',
+)
+
+_INSTANCE_SPEC_KEYS = (
+    'vCPU',
+    'Memory (GB)',
+    'Network Bandwidth (Gbps)',
+    'Ingress Recommended (MBps)',
+    'Ingress Max (MBps)',
+    'Egress Recommended (MBps)',
+    'Egress Max (MBps)',
+    'Partitions per Broker Recommended',
+    'Partitions per Broker Max',
+)
+
+_INSTANCE_SPECS_NT = {
+    instance_type: InstanceSpec(*(specs[key] for key in _INSTANCE_SPEC_KEYS))
+    for instance_type, specs in INSTANCE_SPECS.items()
+}
+
+_STANDARD_KEYS = tuple(key for key in INSTANCE_SPECS if key.startswith('kafka.'))
+_EXPRESS_KEYS = tuple(key for key in INSTANCE_SPECS if key.startswith('express.'))
+_EXPRESS_TYPES = frozenset(_EXPRESS_KEYS)
+
+# Recommended thresholds for monitoring MSK cluster health
+_THRESHOLDS = {
+    'cpu_utilization': {
+        'recommended_max': RECOMMENDED_CPU_UTILIZATION_PERCENT,
+        'critical_max': MAX_CPU_UTILIZATION_PERCENT,
+        'description': f'Keep below {RECOMMENDED_CPU_UTILIZATION_PERCENT}% regularly; never exceed {MAX_CPU_UTILIZATION_PERCENT}%.',
+    },
+    'disk_utilization': {
+        'warning': STORAGE_UTILIZATION_WARNING_PERCENT,
+        'critical': STORAGE_UTILIZATION_CRITICAL_PERCENT,
+        'description': f'Warning at {STORAGE_UTILIZATION_WARNING_PERCENT}%, critical at {STORAGE_UTILIZATION_CRITICAL_PERCENT}%.',
+    },
+    'replication': {
+        'recommended_factor': RECOMMENDED_REPLICATION_FACTOR,
+        'min_insync_replicas': RECOMMENDED_MIN_INSYNC_REPLICAS,
+        'description': 'For optimal resilience, use replication factor 3 with minimum ISR of 2.',
+    },
+    'under_replicated_partitions': {
+        'tolerance': UNDER_REPLICATED_PARTITIONS_TOLERANCE,
+        'description': 'Any deviation from zero indicates potential replication health issues.',
+    },
+    'leader_imbalance': {
+        'tolerance_percent': LEADER_IMBALANCE_TOLERANCE_PERCENT,
+        'description': f'Maintain leader distribution within {LEADER_IMBALANCE_TOLERANCE_PERCENT}% balance to avoid performance bottlenecks.',
+    },
+}
+
+_BEST_PRACTICES = {
+    'thresholds': _THRESHOLDS,
+    'instance_specs': INSTANCE_SPECS,
+    'instance_categories': {
+        'standard': _STANDARD_KEYS,
+        'express': _EXPRESS_KEYS,
+    },
+}
+
+# The global best practices document only depends on module-level constants, so it is
+# serialized once at import time rather than on every resource request.
+_BEST_PRACTICES_JSON = json.dumps(_BEST_PRACTICES, ensure_ascii=False, separators=(',', ':'))
+
+
+_THROUGHPUT_NOTE = '(Note: CloudWatch metrics may be in bytes; ensure proper conversion between bytes and megabytes)'
+
+
+def _preformat_instance_fields(instance_type: str, specs: dict) -> dict:
+    """Build the cluster best practices fields that only depend on the instance type.
+
+    Fields that depend on the number of brokers are set to None as placeholders so that
+    get_cluster_best_practices keeps a stable key order when filling them in.
+    """
+    return {
+        'Instance Type': f'{instance_type} (provided as input)',
+        'Number of Brokers': None,
+        'vCPU per Broker': specs['vCPU'],
+        'Memory (GB) per Broker': f'{specs["Memory (GB)"]} (available on the host)',
+        'Network Bandwidth (Gbps) per Broker': f'{specs["Network Bandwidth (Gbps)"]} (available on the host)',
+        'Ingress Throughput Recommended (MBps)': f'{specs["Ingress Recommended (MBps)"]} {_THROUGHPUT_NOTE}',
+        'Ingress Throughput Max (MBps)': f'{specs["Ingress Max (MBps)"]} {_THROUGHPUT_NOTE}',
+        'Egress Throughput Recommended (MBps)': f'{specs["Egress Recommended (MBps)"]} {_THROUGHPUT_NOTE}',
+        'Egress Throughput Max (MBps)': f'{specs["Egress Max (MBps)"]} {_THROUGHPUT_NOTE}',
+        'Recommended Partitions per Broker': specs['Partitions per Broker Recommended'],
+        'Max Partitions per Broker': f'{specs["Partitions per Broker Max"]} (Note: Each partition should be 3-way replicated. For example, 1000 total partitions with three brokers will mean each broker has 1000 partitions.)',
+        'Recommended Max Partitions per Cluster': None,
+        'Max Partitions per Cluster': None,
+        'CPU Utilization Guidelines': f'Keep below {RECOMMENDED_CPU_UTILIZATION_PERCENT}% regularly; never exceed {MAX_CPU_UTILIZATION_PERCENT}%.',
+        'Disk Utilization Guidelines': f'Warning at {STORAGE_UTILIZATION_WARNING_PERCENT}%, critical at {STORAGE_UTILIZATION_CRITICAL_PERCENT}%.',
+        'Replication Factor': None,
+        'Minimum In-Sync Replicas': None,
+        'Under-Replicated Partitions Tolerance': UNDER_REPLICATED_PARTITIONS_TOLERANCE,
+        'Leader Imbalance Tolerance (%)': LEADER_IMBALANCE_TOLERANCE_PERCENT,
+    }
+
+
+# Instance-type dependent fields of the cluster best practices, formatted once at import time
+_PREFORMATTED = {
+    instance_type: _preformat_instance_fields(instance_type, specs)
+    for instance_type, specs in INSTANCE_SPECS.items()
+}
+
+
+@lru_cache(maxsize=512)
 def get_cluster_best_practices(instance_type: str, number_of_brokers: int) -> dict:
     """Provides detailed best practices and quotas for AWS MSK clusters.
 
+    Results are memoized per (instance_type, number_of_brokers), so the returned
+    dict is shared between callers and must not be mutated.
+
     Args:
         instance_type (str): The AWS MSK broker instance type (e.g., kafka.m5.large).
         number_of_brokers (int): The total number of brokers in the MSK cluster.
@@ -303,47 +417,30 @@ def get_cluster_best_practices(instance_type: str, number_of_brokers: int) -> di
     Returns:
         dict: Detailed best practice guidelines and recommended quotas.
     """
-    if instance_type not in INSTANCE_SPECS:
+    specs = _INSTANCE_SPECS_NT.get(instance_type)
+    if specs is None:
         return {'Error': f"Instance type '{instance_type}' is not supported or recognized."}
 
-    specs = INSTANCE_SPECS[instance_type]
-    recommended_cluster_partitions = specs['Partitions per Broker Recommended'] * number_of_brokers
-    max_cluster_partitions = specs['Partitions per Broker Max'] * number_of_brokers
+    recommended_cluster_partitions = specs.partitions_rec * number_of_brokers
+    max_cluster_partitions = specs.partitions_max * number_of_brokers
 
-    replication_factor = (
-        RECOMMENDED_REPLICATION_FACTOR
-        if number_of_brokers >= RECOMMENDED_REPLICATION_FACTOR
-        else number_of_brokers
-    )
-    min_insync_replicas = (
-        RECOMMENDED_MIN_INSYNC_REPLICAS
-        if number_of_brokers >= RECOMMENDED_REPLICATION_FACTOR
-        else number_of_brokers
-    )
+    # Clusters smaller than the recommended replication factor are capped at their broker count
+    has_quorum = number_of_brokers >= RECOMMENDED_REPLICATION_FACTOR
+    replication_factor = RECOMMENDED_REPLICATION_FACTOR if has_quorum else number_of_brokers
+    min_insync_replicas = RECOMMENDED_MIN_INSYNC_REPLICAS if has_quorum else number_of_brokers
 
     # Determine if this is an express cluster type
-    is_express_cluster = instance_type.startswith('express.')
+    is_express_cluster = instance_type in _EXPRESS_TYPES
 
     # For express clusters, always use replication factor of 3
     if is_express_cluster:
         replication_factor = 3
 
     return {
-        'Instance Type': f'{instance_type} (provided as input)',
+        **_PREFORMATTED[instance_type],
         'Number of Brokers': f'{number_of_brokers} (provided as input)',
-        'vCPU per Broker': specs['vCPU'],
-        'Memory (GB) per Broker': f'{specs["Memory (GB)"]} (available on the host)',
-        'Network Bandwidth (Gbps) per Broker': f'{specs["Network Bandwidth (Gbps)"]} (available on the host)',
-        'Ingress Throughput Recommended (MBps)': f'{specs["Ingress Recommended (MBps)"]} (Note: CloudWatch metrics may be in bytes; ensure proper conversion between bytes and megabytes)',
-        'Ingress Throughput Max (MBps)': f'{specs["Ingress Max (MBps)"]} (Note: CloudWatch metrics may be in bytes; ensure proper conversion between bytes and megabytes)',
-        'Egress Throughput Recommended (MBps)': f'{specs["Egress Recommended (MBps)"]} (Note: CloudWatch metrics may be in bytes; ensure proper conversion between bytes and megabytes)',
-        'Egress Throughput Max (MBps)': f'{specs["Egress Max (MBps)"]} (Note: CloudWatch metrics may be in bytes; ensure proper conversion between bytes and megabytes)',
-        'Recommended Partitions per Broker': specs['Partitions per Broker Recommended'],
-        'Max Partitions per Broker': f'{specs["Partitions per Broker Max"]} (Note: Each partition should be 3-way replicated. For example, 1000 total partitions with three brokers will mean each broker has 1000 partitions.)',
         'Recommended Max Partitions per Cluster': recommended_cluster_partitions,
         'Max Partitions per Cluster': max_cluster_partitions,
-        'CPU Utilization Guidelines': f'Keep below {RECOMMENDED_CPU_UTILIZATION_PERCENT}% regularly; never exceed {MAX_CPU_UTILIZATION_PERCENT}%.',
-        'Disk Utilization Guidelines': f'Warning at {STORAGE_UTILIZATION_WARNING_PERCENT}%, critical at {STORAGE_UTILIZATION_CRITICAL_PERCENT}%.',
         'Replication Factor': f'{replication_factor}'
         + (
             ' (Note: For express clusters, replication factor should always be 3)'
@@ -351,11 +448,19 @@ def get_cluster_best_practices(instance_type: str, number_of_brokers: int) -> di
             else ' (recommended)'
         ),
         'Minimum In-Sync Replicas': min_insync_replicas,
-        'Under-Replicated Partitions Tolerance': UNDER_REPLICATED_PARTITIONS_TOLERANCE,
-        'Leader Imbalance Tolerance (%)': LEADER_IMBALANCE_TOLERANCE_PERCENT,
     }
 
 
+@lru_cache(maxsize=512)
+def _cluster_best_practices_json(instance_type: str, number_of_brokers: int) -> str:
+    """Serialize get_cluster_best_practices, caching the JSON string per input."""
+    return json.dumps(
+        get_cluster_best_practices(instance_type, number_of_brokers),
+        ensure_ascii=False,
+        separators=(',', ':'),
+    )
+
+
 async def register_module(mcp: FastMCP) -> None:
     """Register MSK best practices resources with the MCP server."""
 
@@ -382,41 +487,7 @@ async def register_module(mcp: FastMCP) -> None:
         Returns:
             JSON string containing all best practice guidelines and specifications
         """
-        # Create a comprehensive best practices object
-        best_practices = {
-            'thresholds': {
-                'cpu_utilization': {
-                    'recommended_max': RECOMMENDED_CPU_UTILIZATION_PERCENT,
-                    'critical_max': MAX_CPU_UTILIZATION_PERCENT,
-                    'description': f'Keep below {RECOMMENDED_CPU_UTILIZATION_PERCENT}% regularly; never exceed {MAX_CPU_UTILIZATION_PERCENT}%.',
-                },
-                'disk_utilization': {
-                    'warning': STORAGE_UTILIZATION_WARNING_PERCENT,
-                    'critical': STORAGE_UTILIZATION_CRITICAL_PERCENT,
-                    'description': f'Warning at {STORAGE_UTILIZATION_WARNING_PERCENT}%, critical at {STORAGE_UTILIZATION_CRITICAL_PERCENT}%.',
-                },
-                'replication': {
-                    'recommended_factor': RECOMMENDED_REPLICATION_FACTOR,
-                    'min_insync_replicas': RECOMMENDED_MIN_INSYNC_REPLICAS,
-                    'description': 'For optimal resilience, use replication factor 3 with minimum ISR of 2.',
-                },
-                'under_replicated_partitions': {
-                    'tolerance': UNDER_REPLICATED_PARTITIONS_TOLERANCE,
-                    'description': 'Any deviation from zero indicates potential replication health issues.',
-                },
-                'leader_imbalance': {
-                    'tolerance_percent': LEADER_IMBALANCE_TOLERANCE_PERCENT,
-                    'description': f'Maintain leader distribution within {LEADER_IMBALANCE_TOLERANCE_PERCENT}% balance to avoid performance bottlenecks.',
-                },
-            },
-            'instance_specs': INSTANCE_SPECS,
-            'instance_categories': {
-                'standard': [key for key in INSTANCE_SPECS.keys() if key.startswith('kafka.')],
-                'express': [key for key in INSTANCE_SPECS.keys() if key.startswith('express.')],
-            },
-        }
-
-        return json.dumps(best_practices)
+        return _BEST_PRACTICES_JSON
 
     @mcp.resource(
         uri='resource://msk-best-practices/cluster/{instance_type}/{number_of_brokers}',
@@ -454,5 +525,4 @@ async def register_module(mcp: FastMCP) -> None:
         Returns:
             JSON string containing best practice guidelines and recommended quotas
         """
-        result = get_cluster_best_practices(instance_type, int(number_of_brokers))
-        return json.dumps(result)
+        return _cluster_best_practices_json(instance_type, int(number_of_brokers))
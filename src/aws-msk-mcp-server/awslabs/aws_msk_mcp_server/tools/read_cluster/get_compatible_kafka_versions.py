@@ -33,11 +33,8 @@ def get_compatible_kafka_versions(cluster_arn=None, client=None):
             'Client must be provided. This function should only be called from get_cluster_info.'
         )
 
-    # Example implementation
-    params = {}
+    # ClusterArn is optional
     if cluster_arn:
-        params['ClusterArn'] = cluster_arn
+        return client.get_compatible_kafka_versions(ClusterArn=cluster_arn)
 
-    response = client.get_compatible_kafka_versions(**params)
-
-    return response
+    return client.get_compatible_kafka_versions()
@@ -35,12 +35,10 @@ def list_cluster_operations(cluster_arn, client, max_results=10, next_token=None
             'Client must be provided. This function should only be called from get_cluster_info.'
         )
 
-    # Example implementation
-    params = {'ClusterArn': cluster_arn, 'MaxResults': max_results}
-
+    # NextToken is only sent when paginating
     if next_token:
-        params['NextToken'] = next_token
-
-    response = client.list_cluster_operations_v2(**params)
+        return client.list_cluster_operations_v2(
+            ClusterArn=cluster_arn, MaxResults=max_results, NextToken=next_token
+        )
 
-    return response
+    return client.list_cluster_operations_v2(ClusterArn=cluster_arn, MaxResults=max_results)
@@ -17,6 +17,7 @@ This module provides functions to retrieve information about MSK clusters.
 """
 
 import boto3
+import threading
 from .describe_cluster import describe_cluster
 from .describe_cluster_operation import describe_cluster_operation
 from .get_bootstrap_brokers import get_bootstrap_brokers
@@ -28,8 +29,51 @@ from .list_nodes import list_nodes
 from .list_scram_secrets import list_scram_secrets
 from awslabs.aws_msk_mcp_server import __version__
 from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
+from typing import Any, Mapping, Optional
+
+
+# Shared session so credentials are resolved once rather than for every new client.
+# Sessions are not thread-safe, so client creation from it is serialized.
+_SESSION = boto3.Session()
+_SESSION_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _kafka_client(region: str):
+    """Return a Kafka boto3 client for the region, reusing it across tool invocations."""
+    with _SESSION_LOCK:
+        return _SESSION.client(
+            'kafka',
+            region_name=region,
+            config=Config(user_agent_extra=f'awslabs/mcp/aws-msk-mcp-server/{__version__}'),
+        )
+
+
+# Shared default for get_cluster_info kwargs, avoiding a new dict per call
+_EMPTY_KWARGS: Mapping[str, Any] = {}
+
+# Maps each get_cluster_info info_type to a handler taking (cluster_arn, client, kwargs).
+# Paginated handlers extract only the parameters their underlying function accepts.
+_INFO_HANDLERS = {
+    'metadata': lambda arn, client, kwargs: describe_cluster(arn, client),
+    'brokers': lambda arn, client, kwargs: get_bootstrap_brokers(arn, client),
+    'nodes': lambda arn, client, kwargs: list_nodes(arn, client),
+    'compatible_versions': lambda arn, client, kwargs: get_compatible_kafka_versions(arn, client),
+    'policy': lambda arn, client, kwargs: get_cluster_policy(arn, client),
+    'operations': lambda arn, client, kwargs: list_cluster_operations(
+        arn, client, kwargs.get('max_results', 10), kwargs.get('next_token', None)
+    ),
+    'client_vpc_connections': lambda arn, client, kwargs: list_client_vpc_connections(
+        arn, client, kwargs.get('max_results', 10), kwargs.get('next_token', None)
+    ),
+    'scram_secrets': lambda arn, client, kwargs: list_scram_secrets(
+        arn, client, kwargs.get('max_results', None), kwargs.get('next_token', None)
+    ),
+}
 
 
 def register_module(mcp: FastMCP) -> None:
@@ -95,12 +139,7 @@ This operation retrieves detailed information about a specific cluster operation
             ..., description='The Amazon Resource Name (ARN) of the cluster operation'
         ),
     ):
-        # Create a boto3 client
-        client = boto3.client(
-            'kafka',
-            region_name=region,
-            config=Config(user_agent_extra=f'awslabs/mcp/aws-msk-mcp-server/{__version__}'),
-        )
+        client = _kafka_client(region)
         return describe_cluster_operation(cluster_operation_arn, client)
 
     @mcp.tool(
@@ -292,85 +331,35 @@ Output (JSON):
             'all',
             description='Type of information to retrieve (metadata, brokers, nodes, compatible_versions, policy, operations, client_vpc_connections, scram_secrets, all)',
         ),
-        kwargs: dict = Field({}, description='Additional arguments specific to each info type'),
+        kwargs: Optional[dict] = Field(
+            None, description='Additional arguments specific to each info type'
+        ),
     ):
-        # Create a single boto3 client to be shared across all function calls
-        client = boto3.client(
-            'kafka',
-            region_name=region,
-            config=Config(user_agent_extra=f'awslabs/mcp/aws-msk-mcp-server/{__version__}'),
-        )
+        # A single boto3 client is shared across all function calls
+        client = _kafka_client(region)
+        options = kwargs or _EMPTY_KWARGS
 
         if info_type == 'all':
-            # Retrieve all types of information for the cluster
+            # Retrieve all types of information for the cluster. The calls are independent
+            # read-only requests, so they are issued concurrently on the shared client.
             result = {}
 
-            # Use try-except blocks for each function call to handle potential errors
-            try:
-                result['metadata'] = describe_cluster(cluster_arn, client)
-            except Exception as e:
-                result['metadata'] = {'error': str(e)}
-
-            try:
-                result['brokers'] = get_bootstrap_brokers(cluster_arn, client)
-            except Exception as e:
-                result['brokers'] = {'error': str(e)}
-
-            try:
-                result['nodes'] = list_nodes(cluster_arn, client)
-            except Exception as e:
-                result['nodes'] = {'error': str(e)}
-
-            try:
-                result['compatible_versions'] = get_compatible_kafka_versions(cluster_arn, client)
-            except Exception as e:
-                result['compatible_versions'] = {'error': str(e)}
-
-            try:
-                result['policy'] = get_cluster_policy(cluster_arn, client)
-            except Exception as e:
-                result['policy'] = {'error': str(e)}
-
-            try:
-                result['operations'] = list_cluster_operations(cluster_arn, client)
-            except Exception as e:
-                result['operations'] = {'error': str(e)}
-
-            try:
-                result['client_vpc_connections'] = list_client_vpc_connections(cluster_arn, client)
-            except Exception as e:
-                result['client_vpc_connections'] = {'error': str(e)}
-
-            try:
-                result['scram_secrets'] = list_scram_secrets(cluster_arn, client)
-            except Exception as e:
-                result['scram_secrets'] = {'error': str(e)}
+            with ThreadPoolExecutor(max_workers=len(_INFO_HANDLERS)) as executor:
+                futures = {
+                    key: executor.submit(handler, cluster_arn, client, _EMPTY_KWARGS)
+                    for key, handler in _INFO_HANDLERS.items()
+                }
+
+                # Record errors per component so one failure does not hide the others
+                for key, future in futures.items():
+                    try:
+                        result[key] = future.result()
+                    except Exception as e:
+                        result[key] = {'error': str(e)}
 
             return result
-        elif info_type == 'metadata':
-            return describe_cluster(cluster_arn, client)
-        elif info_type == 'brokers':
-            return get_bootstrap_brokers(cluster_arn, client)
-        elif info_type == 'nodes':
-            return list_nodes(cluster_arn, client)
-        elif info_type == 'compatible_versions':
-            return get_compatible_kafka_versions(cluster_arn, client)
-        elif info_type == 'policy':
-            return get_cluster_policy(cluster_arn, client)
-        elif info_type == 'operations':
-            # Extract only the parameters that list_cluster_operations accepts
-            max_results = kwargs.get('max_results', 10)
-            next_token = kwargs.get('next_token', None)
-            return list_cluster_operations(cluster_arn, client, max_results, next_token)
-        elif info_type == 'client_vpc_connections':
-            # Extract only the parameters that list_client_vpc_connections accepts
-            max_results = kwargs.get('max_results', 10)
-            next_token = kwargs.get('next_token', None)
-            return list_client_vpc_connections(cluster_arn, client, max_results, next_token)
-        elif info_type == 'scram_secrets':
-            # Extract only the parameters that list_scram_secrets accepts
-            max_results = kwargs.get('max_results', None)
-            next_token = kwargs.get('next_token', None)
-            return list_scram_secrets(cluster_arn, client, max_results, next_token)
-        else:
+
+        handler = _INFO_HANDLERS.get(info_type)
+        if handler is None:
             raise ValueError(f'Unsupported info_type: {info_type}')
+        return handler(cluster_arn, client, options)
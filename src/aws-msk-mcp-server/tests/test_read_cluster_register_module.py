@@ -14,14 +14,23 @@
 
 """Unit tests for the read_cluster register_module."""
 
+import threading
 import unittest
-from awslabs.aws_msk_mcp_server.tools.read_cluster.register_module import register_module
+from awslabs.aws_msk_mcp_server.tools.read_cluster.register_module import (
+    _SESSION,
+    _kafka_client,
+    register_module,
+)
 from unittest.mock import Mock, call, patch
 
 
 class TestReadClusterRegisterModule(unittest.TestCase):
     """Tests for the read_cluster register_module."""
 
+    def setUp(self):
+        """Clear the cached Kafka clients so each test sees its own session client mock."""
+        _kafka_client.cache_clear()
+
     def test_register_module(self):
         """Test that register_module registers the expected tools."""
         # Setup
@@ -40,7 +49,7 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         mock_mcp.tool.assert_has_calls(expected_tool_calls, any_order=True)
         self.assertEqual(mock_mcp.tool.call_count, len(expected_tool_calls))
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
     def test_describe_cluster_operation_tool(self, mock_boto3_client):
         """Test the describe_cluster_operation_tool function."""
         # Setup
@@ -76,7 +85,7 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, {'ClusterOperationInfo': {'Status': 'Success'}})
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
     def test_get_cluster_info_all(self, mock_boto3_client):
         """Test the get_cluster_info function with info_type='all'."""
         # Setup
@@ -119,6 +128,24 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         self.assertEqual(mock_boto3_client.call_args[1]['region_name'], 'us-west-2')
         self.assertIn('config', mock_boto3_client.call_args[1])
 
+        # Verify each API was called on the shared client with the default pagination
+        mock_client.describe_cluster_v2.assert_called_once_with(ClusterArn='test-cluster-arn')
+        mock_client.get_bootstrap_brokers.assert_called_once_with(ClusterArn='test-cluster-arn')
+        mock_client.list_nodes.assert_called_once_with(
+            ClusterArn='test-cluster-arn', MaxResults=10
+        )
+        mock_client.get_compatible_kafka_versions.assert_called_once_with(
+            ClusterArn='test-cluster-arn'
+        )
+        mock_client.get_cluster_policy.assert_called_once_with(ClusterArn='test-cluster-arn')
+        mock_client.list_cluster_operations_v2.assert_called_once_with(
+            ClusterArn='test-cluster-arn', MaxResults=10
+        )
+        mock_client.list_client_vpc_connections.assert_called_once_with(
+            ClusterArn='test-cluster-arn', MaxResults=10
+        )
+        mock_client.list_scram_secrets.assert_called_once_with(ClusterArn='test-cluster-arn')
+
         # Verify the result structure
         self.assertIn('metadata', result)
         self.assertIn('brokers', result)
@@ -129,7 +156,7 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         self.assertIn('client_vpc_connections', result)
         self.assertIn('scram_secrets', result)
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
     def test_get_cluster_info_all_with_errors(self, mock_boto3_client):
         """Test the get_cluster_info function with info_type='all' when some calls fail."""
         # Setup
@@ -168,7 +195,50 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         self.assertEqual(result['client_vpc_connections'], {'error': 'VPC connections error'})
         self.assertEqual(result['scram_secrets'], {'error': 'SCRAM secrets error'})
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
+    def test_get_cluster_info_all_runs_calls_concurrently(self, mock_boto3_client):
+        """Test that info_type='all' issues its API calls concurrently."""
+        # Setup
+        mock_mcp = Mock()
+        mock_tool_decorator = Mock()
+        mock_mcp.tool.return_value = mock_tool_decorator
+        mock_client = Mock()
+        mock_boto3_client.return_value = mock_client
+
+        # Every call waits until all eight calls are in flight; sequential calls would time out
+        barrier = threading.Barrier(8, timeout=5)
+
+        def wait_for_all(**kwargs):
+            barrier.wait()
+            return {}
+
+        for method in (
+            'describe_cluster_v2',
+            'get_bootstrap_brokers',
+            'list_nodes',
+            'get_compatible_kafka_versions',
+            'get_cluster_policy',
+            'list_cluster_operations_v2',
+            'list_client_vpc_connections',
+            'list_scram_secrets',
+        ):
+            getattr(mock_client, method).side_effect = wait_for_all
+
+        # Register the module
+        register_module(mock_mcp)
+
+        # Get the tool function
+        tool_func = mock_tool_decorator.call_args_list[1][0][0]
+
+        # Call the tool function with info_type='all'
+        result = tool_func(region='us-west-2', cluster_arn='test-cluster-arn', info_type='all')
+
+        # Verify no call failed waiting for the others
+        self.assertFalse(barrier.broken)
+        for value in result.values():
+            self.assertEqual(value, {})
+
+    @patch.object(_SESSION, 'client')
     def test_get_cluster_info_metadata(self, mock_boto3_client):
         """Test the get_cluster_info function with info_type='metadata'."""
         # Setup
@@ -202,7 +272,7 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, {'ClusterInfo': {'Status': 'Active'}})
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
     def test_get_cluster_info_brokers(self, mock_boto3_client):
         """Test the get_cluster_info function with info_type='brokers'."""
         # Setup
@@ -230,7 +300,7 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, {'BootstrapBrokerString': 'broker1,broker2'})
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
     def test_get_cluster_info_nodes(self, mock_boto3_client):
         """Test the get_cluster_info function with info_type='nodes'."""
         # Setup
@@ -258,7 +328,7 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, {'NodeInfoList': [{'BrokerId': 1}]})
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
     def test_get_cluster_info_compatible_versions(self, mock_boto3_client):
         """Test the get_cluster_info function with info_type='compatible_versions'."""
         # Setup
@@ -290,7 +360,7 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, {'CompatibleKafkaVersions': ['2.8.1']})
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
     def test_get_cluster_info_policy(self, mock_boto3_client):
         """Test the get_cluster_info function with info_type='policy'."""
         # Setup
@@ -316,7 +386,7 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, {'Policy': 'policy-json'})
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
     def test_get_cluster_info_operations(self, mock_boto3_client):
         """Test the get_cluster_info function with info_type='operations'."""
         # Setup
@@ -351,7 +421,40 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, {'ClusterOperationInfoList': [{'OperationId': 1}]})
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
+    def test_get_cluster_info_operations_without_kwargs(self, mock_boto3_client):
+        """Test the get_cluster_info function with info_type='operations' and no kwargs."""
+        # Setup
+        mock_mcp = Mock()
+        mock_tool_decorator = Mock()
+        mock_mcp.tool.return_value = mock_tool_decorator
+        mock_client = Mock()
+        mock_boto3_client.return_value = mock_client
+        mock_client.list_cluster_operations_v2.return_value = {'ClusterOperationInfoList': []}
+
+        # Register the module
+        register_module(mock_mcp)
+
+        # Get the tool function
+        tool_func = mock_tool_decorator.call_args_list[1][0][0]
+
+        # Call the tool function with info_type='operations' and no kwargs
+        result = tool_func(
+            region='us-west-2',
+            cluster_arn='test-cluster-arn',
+            info_type='operations',
+            kwargs=None,
+        )
+
+        # Verify list_cluster_operations_v2 was called with the default pagination
+        mock_client.list_cluster_operations_v2.assert_called_once_with(
+            ClusterArn='test-cluster-arn', MaxResults=10
+        )
+
+        # Verify the result
+        self.assertEqual(result, {'ClusterOperationInfoList': []})
+
+    @patch.object(_SESSION, 'client')
     def test_get_cluster_info_client_vpc_connections(self, mock_boto3_client):
         """Test the get_cluster_info function with info_type='client_vpc_connections'."""
         # Setup
@@ -386,7 +489,7 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, {'VpcConnectionInfoList': [{'VpcId': 'vpc-123'}]})
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
     def test_get_cluster_info_scram_secrets(self, mock_boto3_client):
         """Test the get_cluster_info function with info_type='scram_secrets'."""
         # Setup
@@ -419,7 +522,7 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, {'SecretArnList': ['secret-arn']})
 
-    @patch('boto3.client')
+    @patch.object(_SESSION, 'client')
     def test_get_cluster_info_invalid_type(self, mock_boto3_client):
         """Test the get_cluster_info function with an invalid info_type."""
         # Setup
@@ -442,6 +545,21 @@ class TestReadClusterRegisterModule(unittest.TestCase):
         # Verify the error message
         self.assertIn('Unsupported info_type', str(context.exception))
 
+    @patch.object(_SESSION, 'client')
+    def test_kafka_client_is_cached_per_region(self, mock_boto3_client):
+        """Test that the Kafka client is created once per region and then reused."""
+        mock_boto3_client.side_effect = lambda *args, **kwargs: Mock()
+
+        # Repeated calls for the same region reuse the client
+        client = _kafka_client('us-west-2')
+        self.assertIs(_kafka_client('us-west-2'), client)
+        mock_boto3_client.assert_called_once()
+
+        # A different region gets its own client
+        self.assertIsNot(_kafka_client('us-east-1'), client)
+        self.assertEqual(mock_boto3_client.call_count, 2)
+        self.assertEqual(mock_boto3_client.call_args[1]['region_name'], 'us-east-1')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -18,6 +18,7 @@ import json
 import pytest
 import unittest
 from awslabs.aws_msk_mcp_server.resources.best_practices import (
+    _INSTANCE_SPECS_NT,
     INSTANCE_SPECS,
     LEADER_IMBALANCE_TOLERANCE_PERCENT,
     MAX_CPU_UTILIZATION_PERCENT,
@@ -104,6 +105,20 @@ class TestBestPractices:
         assert f'{num_brokers} (recommended)' == result['Replication Factor']
         assert result['Minimum In-Sync Replicas'] == num_brokers
 
+    def test_get_cluster_best_practices_is_memoized(self):
+        """Test that repeated calls with the same inputs return the cached result."""
+        first = get_cluster_best_practices('kafka.m5.xlarge', 6)
+        second = get_cluster_best_practices('kafka.m5.xlarge', 6)
+
+        assert first is second
+        assert get_cluster_best_practices('kafka.m5.xlarge', 9) is not first
+
+    def test_instance_specs_tuples_match_instance_specs(self):
+        """Test that the InstanceSpec tuples mirror the INSTANCE_SPECS values."""
+        assert _INSTANCE_SPECS_NT.keys() == INSTANCE_SPECS.keys()
+        for instance_type, specs in INSTANCE_SPECS.items():
+            assert tuple(_INSTANCE_SPECS_NT[instance_type]) == tuple(specs.values())
+
     @pytest.mark.asyncio
     async def test_register_module(self):
         """Test that register_module registers the expected resources."""
@@ -211,6 +226,28 @@ class TestBestPractices:
         )
         assert 'description' in result['thresholds']['leader_imbalance']
 
+    @pytest.mark.asyncio
+    async def test_msk_best_practices_resource_is_cached(self):
+        """Test that the msk_best_practices resource returns the precomputed JSON document."""
+        # Create a mock MCP instance
+        mock_mcp = MagicMock()
+        mock_resource_decorator = MagicMock()
+        mock_mcp.resource.return_value = mock_resource_decorator
+
+        # Call register_module to get the resource functions
+        await register_module(mock_mcp)
+
+        # Extract the msk_best_practices function
+        msk_best_practices_func = mock_resource_decorator.call_args_list[0][0][0]
+
+        # Repeated calls should return the same serialized document
+        first = await msk_best_practices_func()
+        second = await msk_best_practices_func()
+        assert first is second
+
+        # The document is encoded with compact separators
+        assert first == json.dumps(json.loads(first), ensure_ascii=False, separators=(',', ':'))
+
     @pytest.mark.asyncio
     async def test_msk_cluster_best_practices_resource(self):
         """Test the msk_cluster_best_practices resource function."""